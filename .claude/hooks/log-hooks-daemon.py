@@ -0,0 +1,74 @@
+#!/usr/bin/env -S uv run python
+"""Optional batching writer for log-hooks.py.
+
+Every hook invocation is a separate short-lived process; when many hooks fire
+in a row they each open, lock, write, and close the log file. Running this
+daemon and exporting CLAUDE_HOOK_LOG_SOCK (for both the daemon and Claude)
+collapses each hook's work to a single sendto over a Unix datagram socket.
+The daemon batches messages and appends them with one writev per batch.
+"""
+
+import fcntl
+import os
+import select
+import socket
+import sys
+
+# Flush after this many queued messages, or once the window elapses with no
+# new message.
+BATCH_MAX = 64
+BATCH_WINDOW = 0.05
+
+LOG_FILE = os.path.join(
+    os.environ.get('CLAUDE_PROJECT_DIR', '.'),
+    '.claude', 'hooks', 'logs', 'hooks-log.jsonl',
+)
+
+def flush(fd, batch):
+    """Write all queued lines in one scatter-gather append."""
+    fcntl.flock(fd, fcntl.LOCK_EX)
+    try:
+        os.writev(fd, batch)
+    finally:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    batch.clear()
+
+def main():
+    sock_path = os.environ.get('CLAUDE_HOOK_LOG_SOCK')
+    if not sock_path:
+        print("CLAUDE_HOOK_LOG_SOCK is not set", file=sys.stderr)
+        sys.exit(1)
+
+    os.makedirs(os.path.dirname(LOG_FILE), exist_ok=True)
+    if os.path.exists(sock_path):
+        os.unlink(sock_path)
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    sock.bind(sock_path)
+    fd = os.open(LOG_FILE, os.O_WRONLY | os.O_APPEND | os.O_CREAT | os.O_CLOEXEC, 0o644)
+
+    batch = []
+    try:
+        while True:
+            # Block indefinitely while idle; once a message is queued, wait
+            # only a short window for more before flushing.
+            timeout = BATCH_WINDOW if batch else None
+            readable, _, _ = select.select([sock], [], [], timeout)
+            if readable:
+                msg = sock.recv(1 << 20)
+                if not msg.endswith(b'\n'):
+                    msg += b'\n'
+                batch.append(msg)
+            if batch and (not readable or len(batch) >= BATCH_MAX):
+                flush(fd, batch)
+    except KeyboardInterrupt:
+        if batch:
+            flush(fd, batch)
+    finally:
+        os.close(fd)
+        sock.close()
+        os.unlink(sock_path)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,61 +1,269 @@
 #!/usr/bin/env -S uv run python
 
-import json
+# This script runs as a fresh process for every hook invocation, so module
+# import time is a real cost: import only what the happy path needs and pull
+# in json (orjson fallback), fcntl (oversized writes), and ijson (huge
+# payloads) lazily at their call sites.
+import re
 import sys
 import os
-import fcntl
-from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+    import json
 
 # Sensitive keys to redact from logs.
-SENSITIVE_KEYS = {
+SENSITIVE_KEYS = frozenset({
     "api_key", "token", "password", "secret", "authorization",
     "cookie", "session", "access_token", "refresh_token",
-}
-
-def redact_sensitive(value):
-    """Recursively redact sensitive information from nested data structures."""
-    if isinstance(value, dict):
-        return {
-            key: ("<redacted>" if key.lower() in SENSITIVE_KEYS else redact_sensitive(val))
-            for key, val in value.items()
-        }
-    if isinstance(value, list):
-        return [redact_sensitive(v) for v in value]
-    return value
+})
+
+# Resolve the log file path once at import; every hook invocation uses it.
+_LOG_FILE = os.path.join(
+    os.environ.get('CLAUDE_PROJECT_DIR', '.'),
+    '.claude', 'hooks', 'logs', 'hooks-log.jsonl',
+)
+
+# Optional batching daemon (log-hooks-daemon.py). When set, log lines are
+# sent over a Unix datagram socket instead of written directly.
+_LOG_SOCK = os.environ.get('CLAUDE_HOOK_LOG_SOCK')
+
+# Payloads above this size are stream-redacted with ijson (when installed)
+# instead of being materialized as a dict tree.
+_STREAM_THRESHOLD = 1 << 20
+
+# Quick scan for any sensitive key name appearing as a JSON object key; no
+# match means the payload needs no redaction at all.
+_SENS_RE = re.compile(
+    b'"(?:' + b'|'.join(sorted(k.encode() for k in SENSITIVE_KEYS)) + b')"',
+    re.IGNORECASE,
+)
+
+def redact_inplace(root):
+    """Redact sensitive values in nested data structures, mutating in place.
+
+    The parsed payload exists only to be reserialized, so overwriting
+    sensitive values directly avoids rebuilding the whole tree — no second
+    copy of large tool-call payloads. Walks with an explicit work stack
+    instead of recursing; redacted subtrees are never descended into.
+    """
+    sens = SENSITIVE_KEYS
+    _lower = str.lower
+    stack = [root]
+    while stack:
+        v = stack.pop()
+        if type(v) is dict:
+            for key, val in v.items():
+                if type(key) is str and _lower(key) in sens:
+                    v[key] = "<redacted>"
+                elif type(val) is dict or type(val) is list:
+                    stack.append(val)
+        elif type(v) is list:
+            for val in v:
+                if type(val) is dict or type(val) is list:
+                    stack.append(val)
+
+def _stream_redact(raw):
+    """Serialize a redacted copy of raw JSON bytes without building the tree.
+
+    Tokenizes with ijson and re-emits each token, substituting "<redacted>"
+    for values under sensitive keys. Working memory is O(nesting depth)
+    rather than O(payload), which matters for multi-megabyte tool outputs.
+    Returns a single bytes line ending in a newline. Raises ImportError if
+    ijson isn't installed.
+    """
+    import io
+    import json
+    import ijson
+
+    sens = SENSITIVE_KEYS
+    _lower = str.lower
+    _dumps = json.dumps
+    out = []
+    emit = out.append
+    comma = [False]  # per open container: does the next item need a comma?
+    after_key = False
+    skip_value = False  # next value event belongs to a redacted key
+    skip_depth = 0  # inside a redacted container: unbalanced start events
+
+    for _, event, value in ijson.parse(io.BytesIO(raw)):
+        if skip_depth:
+            if event == 'start_map' or event == 'start_array':
+                skip_depth += 1
+            elif event == 'end_map' or event == 'end_array':
+                skip_depth -= 1
+            continue
+        if skip_value:
+            skip_value = False
+            if event == 'start_map' or event == 'start_array':
+                skip_depth = 1
+            continue
+        if event == 'map_key':
+            if comma[-1]:
+                emit(',')
+            comma[-1] = True
+            emit(_dumps(value))
+            emit(':')
+            if _lower(value) in sens:
+                emit('"<redacted>"')
+                skip_value = True
+            else:
+                after_key = True
+            continue
+        if event == 'end_map':
+            comma.pop()
+            emit('}')
+            continue
+        if event == 'end_array':
+            comma.pop()
+            emit(']')
+            continue
+        # A new value begins: object values already had their comma emitted
+        # with the key, array elements need one here.
+        if after_key:
+            after_key = False
+        else:
+            if comma[-1]:
+                emit(',')
+            comma[-1] = True
+        if event == 'start_map':
+            emit('{')
+            comma.append(False)
+        elif event == 'start_array':
+            emit('[')
+            comma.append(False)
+        elif event == 'string':
+            emit(_dumps(value))
+        elif event == 'boolean':
+            emit('true' if value else 'false')
+        elif event == 'null':
+            emit('null')
+        else:  # integer / double / number (Decimal from some backends)
+            emit(str(value))
+
+    return (''.join(out) + '\n').encode('utf-8')
+
+def _append_log(*bufs):
+    """Append one log line, passed as one or more bytes buffers.
+
+    Multiple buffers (e.g. payload + newline) go to the kernel as a single
+    scatter-gather writev — no concatenation, no extra allocation.
+    """
+    # With the daemon running, the whole append collapses to one sendto; the
+    # daemon batches concurrent lines into a single writev. Any socket error
+    # (daemon gone, message too big) falls back to the direct write below.
+    if _LOG_SOCK:
+        import socket
+        try:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+            try:
+                sock.sendto(bufs[0] if len(bufs) == 1 else b''.join(bufs), _LOG_SOCK)
+                return
+            finally:
+                sock.close()
+        except OSError:
+            pass
+
+    # Ensure logs directory exists. A single isdir() check covers the common
+    # case; makedirs only runs on first use.
+    log_dir = os.path.dirname(_LOG_FILE)
+    if not os.path.isdir(log_dir):
+        os.makedirs(log_dir, exist_ok=True)
+
+    # POSIX guarantees O_APPEND writes up to PIPE_BUF bytes are atomic, which
+    # covers nearly all hook payloads — no flock needed. Larger writes can
+    # interleave with concurrent writers, so keep a locked path for those.
+    fd = os.open(_LOG_FILE, os.O_WRONLY | os.O_APPEND | os.O_CREAT | os.O_CLOEXEC, 0o644)
+    try:
+        if sum(map(len, bufs)) > 4096:
+            import fcntl
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                _write_bufs(fd, bufs)
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        else:
+            _write_bufs(fd, bufs)
+    finally:
+        os.close(fd)
+
+def _write_bufs(fd, bufs):
+    """Write buffers to fd in one syscall: write for one, writev for many."""
+    if len(bufs) == 1:
+        os.write(fd, bufs[0])
+    else:
+        os.writev(fd, bufs)
 
 def log_hook(hook_data):
     """Log hook call to logs directory."""
-    # Ensure logs directory exists.
-    project_dir = os.environ.get('CLAUDE_PROJECT_DIR', '.')
-    log_dir = Path(project_dir) / '.claude' / 'hooks' / 'logs'
-    log_dir.mkdir(parents=True, exist_ok=True)
-    log_file = log_dir / 'hooks-log.jsonl'
-
-    with open(log_file, 'a', encoding='utf-8') as f:
-        # Lock file to prevent concurrent write issues.
-        fcntl.flock(f, fcntl.LOCK_EX)
-        try:
-            redacted_data = redact_sensitive(hook_data)
-            f.write(json.dumps(redacted_data) + '\n')
-            f.flush()
-        finally:
-            fcntl.flock(f, fcntl.LOCK_UN)
+    redact_inplace(hook_data)
+    # orjson's C encoder skips the str->utf-8 transcode and appends the
+    # newline itself; the stdlib fallback hands the newline to writev as a
+    # second iovec rather than concatenating.
+    if orjson is not None:
+        _append_log(orjson.dumps(hook_data, option=orjson.OPT_APPEND_NEWLINE))
+    else:
+        _append_log(json.dumps(hook_data).encode('utf-8'), b'\n')
+
+def _exit_ok():
+    """Exit 0, skipping interpreter teardown.
+
+    The log write is already flushed (unbuffered fd or daemon socket), so
+    gc sweeps, atexit handlers, and module finalization are pure overhead
+    for a run-per-hook script. The error path keeps sys.exit(1) so failures
+    surface normally.
+    """
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os._exit(0)
 
 def main():
-    # Read JSON input from stdin.
-    raw = sys.stdin.read()
+    # Read raw JSON bytes from stdin; decoding the whole payload to str just
+    # to parse it again is wasted work (orjson parses bytes directly).
+    raw = sys.stdin.buffer.read()
+
+    # Fast path: most payloads contain no sensitive key names at all. One
+    # substring scan over the raw bytes decides; on no hit, append the input
+    # verbatim — no parse, no redaction, no re-serialization. The single-line
+    # object/array restriction only keeps the log one entry per line; the
+    # content is appended unvalidated, so a malformed payload with no
+    # sensitive key names is logged as-is rather than rejected with exit 1.
+    if _SENS_RE.search(raw) is None:
+        line = raw.strip()
+        if line and line[0] in b'{[' and b'\n' not in line:
+            _append_log(line, b'\n')
+            _exit_ok()
+
+    # Very large payloads are redacted token-by-token instead of being parsed
+    # into a dict tree. When ijson is missing or parsing fails, fall through
+    # so the regular path handles it.
+    if len(raw) > _STREAM_THRESHOLD:
+        try:
+            buf = _stream_redact(raw)
+        except Exception:
+            pass
+        else:
+            _append_log(buf)
+            _exit_ok()
 
     try:
-        payload = json.loads(raw)
+        if orjson is not None:
+            payload = orjson.loads(raw)
+        else:
+            payload = json.loads(raw)
 
         log_hook(payload)
 
         # Success - prompt will be processed.
-        sys.exit(0)
+        _exit_ok()
 
-    except json.JSONDecodeError as e:
-        # Truncate raw input in error message to prevent log spam.
-        snippet = raw[:500]
+    except ValueError as e:
+        # Both orjson.JSONDecodeError and json.JSONDecodeError are ValueErrors.
+        # Truncate raw input in error message to prevent log spam, decoding
+        # only the snippet.
+        snippet = raw[:500].decode('utf-8', errors='replace')
         print(f"HOOK ERROR: Error parsing JSON: {e}", file=sys.stderr)
         print(f"Raw input (first 500 bytes): {snippet!r}", file=sys.stderr)
         sys.exit(1)
@@ -0,0 +1,91 @@
+#!/usr/bin/env -S uv run python
+"""Set up this repository's Claude Code configuration.
+
+Creates expected directories, marks hook scripts executable, seeds .env from
+.env.example, and runs validate-config.py over the result.
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).parent
+
+# Directories expected by the configuration.
+DIRECTORIES = [
+    '.claude/agents',
+    '.claude/commands',
+    '.claude/hooks',
+    '.claude/hooks/logs',
+    'specs',
+]
+
+# Hook scripts that must be executable.
+HOOK_SCRIPTS = [
+    '.claude/hooks/log-hooks.py',
+    '.claude/hooks/log-hooks-daemon.py',
+]
+
+def create_directory_structure():
+    """Create any missing directories."""
+    # One scandir pass caches which .claude children already exist, so direct
+    # children need no stat at all; deeper paths get a single isdir check and
+    # makedirs is a no-op for anything that exists.
+    claude_dir = REPO_ROOT / '.claude'
+    existing = set()
+    if os.path.isdir(claude_dir):
+        for entry in os.scandir(claude_dir):
+            if entry.is_dir():
+                existing.add(entry.name)
+    for dir_path in DIRECTORIES:
+        prefix, _, child = dir_path.partition('/')
+        if prefix == '.claude' and child in existing:
+            continue
+        created = not os.path.isdir(REPO_ROOT / dir_path)
+        os.makedirs(REPO_ROOT / dir_path, exist_ok=True)
+        if created:
+            print(f"Created {dir_path}/")
+
+def set_permissions():
+    """Make hook scripts executable."""
+    for script in HOOK_SCRIPTS:
+        full_path = os.path.join(REPO_ROOT, script)
+        try:
+            st = os.stat(full_path)
+        except FileNotFoundError:
+            continue
+        # Only chmod when needed; the stat doubles as the existence check.
+        if not st.st_mode & 0o111:
+            os.chmod(full_path, st.st_mode | 0o755)
+
+def setup_environment_file():
+    """Seed .env from .env.example if it doesn't exist yet."""
+    env_example = os.path.join(REPO_ROOT, '.env.example')
+    env_file = os.path.join(REPO_ROOT, '.env')
+    if os.path.isfile(env_example) and not os.path.isfile(env_file):
+        # copyfile dispatches to sendfile on Linux — the copy stays in the
+        # kernel instead of round-tripping through a Python string.
+        shutil.copyfile(env_example, env_file)
+        print("Created .env from .env.example")
+
+def validate_configuration():
+    """Run validate-config.py and report whether the configuration is valid."""
+    # A subprocess keeps this free of importlib spec/loader machinery and
+    # sys.path side effects; the child's exit code is the verdict.
+    result = subprocess.run([sys.executable, str(REPO_ROOT / 'validate-config.py')])
+    return result.returncode == 0
+
+def main():
+    create_directory_structure()
+    set_permissions()
+    setup_environment_file()
+    if not validate_configuration():
+        print("Setup finished with validation errors", file=sys.stderr)
+        sys.exit(1)
+    print("Setup complete")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,235 @@
+#!/usr/bin/env -S uv run python
+"""Validate this repository's Claude Code configuration files.
+
+Checks that expected directories exist, that the JSON configuration files
+parse, and that MCP server entries are well-formed. Placeholder credential
+values are reported as warnings but don't fail validation, since .mcp.json
+ships with them on purpose.
+"""
+
+import json
+import os
+import re
+import sys
+from pathlib import Path
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+REPO_ROOT = Path(__file__).parent
+
+# Parse failures to catch; ijson has its own error hierarchy.
+_JSON_ERRORS = (json.JSONDecodeError,) if ijson is None else (json.JSONDecodeError, ijson.JSONError)
+
+# Directories the configuration expects to exist.
+REQUIRED_DIRS = [
+    '.claude',
+    '.claude/agents',
+    '.claude/commands',
+    '.claude/hooks',
+]
+
+# Markers of placeholder credential values; one compiled case-insensitive
+# scan per value instead of lowercasing it and searching twice.
+_PLACEHOLDER_RE = re.compile(r'get-this-from|your_', re.IGNORECASE)
+
+# JSON files that must parse.
+JSON_FILES = [
+    '.claude/settings.json',
+    '.mcp.json',
+]
+
+def validate_json_file(path):
+    """Parse a JSON file, returning (data, issues)."""
+    if not os.path.isfile(path):
+        return None, [f"{path.name}: missing"]
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f), []
+    except json.JSONDecodeError as e:
+        return None, [f"{path.name}: invalid JSON: {e}"]
+
+def validate_server(name, server, issues, warnings):
+    """Check one MCP server entry, appending to issues and warnings."""
+    if not isinstance(server, dict):
+        issues.append(f"mcpServers.{name}: server entry must be an object")
+        return
+    server_type = server.get('type')
+    if server_type is None:
+        issues.append(f"mcpServers.{name}: missing \"type\"")
+        return
+    if server_type == 'stdio':
+        if 'command' not in server:
+            issues.append(f"mcpServers.{name}: stdio server missing \"command\"")
+    elif server_type in ('sse', 'http'):
+        if 'url' not in server:
+            issues.append(f"mcpServers.{name}: {server_type} server missing \"url\"")
+    else:
+        issues.append(f"mcpServers.{name}: unknown type {server_type!r}")
+    # Placeholder values mean the server isn't fully configured yet.
+    for section in ('env', 'headers'):
+        section_value = server.get(section, {})
+        if not isinstance(section_value, dict):
+            issues.append(f"mcpServers.{name}.{section}: must be an object")
+            continue
+        for key, value in section_value.items():
+            if isinstance(value, str) and _PLACEHOLDER_RE.search(value):
+                warnings.append(f"mcpServers.{name}.{section}.{key}: placeholder value")
+
+def stream_validate_mcp(f, issues, warnings, filename='.mcp.json'):
+    """Validate MCP server entries in one pass over the parser's event stream.
+
+    Tracks the current path with a small stack and checks required fields and
+    placeholder values as tokens arrive — no per-entry dict is ever built, so
+    memory stays O(nesting depth).
+    """
+    stack = []
+    key = None
+    server = None  # (name, seen top-level fields, [type]) for the open entry
+    # After mcpServers, a server name, or env/headers, the next value must be
+    # a map; (kind, label) of the pending expectation, or None. Seeded so the
+    # very first event must open the top-level object.
+    expect = ('map', filename)
+
+    def finish(name, fields, server_type):
+        if 'type' not in fields:
+            issues.append(f"mcpServers.{name}: missing \"type\"")
+        elif server_type == 'stdio':
+            if 'command' not in fields:
+                issues.append(f"mcpServers.{name}: stdio server missing \"command\"")
+        elif server_type in ('sse', 'http'):
+            if 'url' not in fields:
+                issues.append(f"mcpServers.{name}: {server_type} server missing \"url\"")
+        else:
+            issues.append(f"mcpServers.{name}: unknown type {server_type!r}")
+
+    def not_a_map(kind, label):
+        if kind == 'server':
+            issues.append(f"mcpServers.{label}: server entry must be an object")
+        else:
+            issues.append(f"{label}: must be an object")
+
+    for event, value in ijson.basic_parse(f):
+        if event == 'map_key':
+            key = value
+            if len(stack) == 1 and value == 'mcpServers':
+                expect = ('map', 'mcpServers')
+            elif len(stack) == 2 and stack[1] == 'mcpServers':
+                expect = ('server', value)
+            elif len(stack) == 3 and server is not None:
+                server[1].add(value)
+                if value in ('env', 'headers'):
+                    expect = ('map', f"mcpServers.{server[0]}.{value}")
+        elif event == 'start_map':
+            if expect is not None:
+                if expect[0] == 'server':
+                    server = (expect[1], set(), [None])
+                expect = None
+            stack.append(key)
+            key = None
+        elif event == 'start_array':
+            if expect is not None:
+                not_a_map(*expect)
+                expect = None
+            stack.append(key)
+            key = None
+        elif event == 'end_map' or event == 'end_array':
+            stack.pop()
+            if len(stack) == 2 and server is not None:
+                finish(server[0], server[1], server[2][0])
+                server = None
+        elif expect is not None:
+            # Scalar where a map was required.
+            not_a_map(*expect)
+            expect = None
+        elif server is not None:
+            # Scalar inside the open server entry.
+            if len(stack) == 3 and key == 'type':
+                server[2][0] = value
+            elif (len(stack) == 4 and stack[3] in ('env', 'headers')
+                    and isinstance(value, str) and _PLACEHOLDER_RE.search(value)):
+                warnings.append(f"mcpServers.{server[0]}.{stack[3]}.{key}: placeholder value")
+
+def validate_mcp_file(path):
+    """Validate .mcp.json, returning (ok, issues, warnings)."""
+    if not os.path.isfile(path):
+        return False, [f"{path.name}: missing"], []
+    issues = []
+    warnings = []
+    try:
+        if ijson is not None:
+            with open(path, 'rb') as f:
+                stream_validate_mcp(f, issues, warnings, path.name)
+        else:
+            with open(path, encoding='utf-8') as f:
+                config = json.load(f)
+            if not isinstance(config, dict):
+                issues.append(f"{path.name}: must be an object")
+            else:
+                servers = config.get('mcpServers', {})
+                if not isinstance(servers, dict):
+                    issues.append("mcpServers: must be an object")
+                else:
+                    for name, server in servers.items():
+                        validate_server(name, server, issues, warnings)
+    except _JSON_ERRORS as e:
+        return False, [f"{path.name}: invalid JSON: {e}"], []
+    return True, issues, warnings
+
+def main():
+    issues = []
+    warnings = []
+    # Buffer report lines and write them in one go at the end; per-line
+    # print() costs an encode and a write syscall each.
+    out = []
+    emit = out.append
+
+    try:
+        # One scandir pass caches .claude's children; each directory check
+        # below is then a set lookup instead of its own stat.
+        claude_dir = REPO_ROOT / '.claude'
+        claude_exists = os.path.isdir(claude_dir)
+        existing = set()
+        if claude_exists:
+            for entry in os.scandir(claude_dir):
+                if entry.is_dir():
+                    existing.add(entry.name)
+        for dir_path in REQUIRED_DIRS:
+            _, _, child = dir_path.partition('/')
+            if claude_exists and (not child or child in existing):
+                emit(f"ok: {dir_path}/")
+            else:
+                issues.append(f"{dir_path}: missing directory")
+
+        for file_path in JSON_FILES:
+            if file_path == '.mcp.json':
+                ok, file_issues, file_warnings = validate_mcp_file(REPO_ROOT / file_path)
+                issues.extend(file_issues)
+                warnings.extend(file_warnings)
+                if ok:
+                    emit(f"ok: {file_path}")
+            else:
+                data, file_issues = validate_json_file(REPO_ROOT / file_path)
+                issues.extend(file_issues)
+                if data is not None:
+                    emit(f"ok: {file_path}")
+
+        for warning in warnings:
+            emit(f"warning: {warning}")
+
+        if issues:
+            emit(f"{len(issues)} issue(s) found:")
+            for issue in issues:
+                emit(f"  - {issue}")
+            sys.exit(1)
+        emit("Configuration valid")
+    finally:
+        if out:
+            sys.stdout.write('\n'.join(out))
+            sys.stdout.write('\n')
+
+
+if __name__ == '__main__':
+    main()